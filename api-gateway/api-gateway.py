@@ -60,7 +60,7 @@ def load_config():
 
 # Load configuration
 config = load_config()
-API_KEYS = config.get('api_keys', [])
+API_KEYS = frozenset(config.get('api_keys', []))
 ALLOWED_IP_RANGES = [ipaddress.ip_network(cidr) for cidr in config.get('allowed_ip_ranges', [])]
 ALLOWED_UPLOADS: Dict[str, Dict[str, str]] = {
     "ifc": {"dir": "/app/uploads", "extensions": [".ifc"]},